@@ -146,9 +146,8 @@ async def special_datasets(db_pool):
     try:
       query = """SELECT dt.stable_id, al.parent_field, al.field, al.access_level FROM dataset_access_level_table al
                JOIN beacon_dataset dt ON al.dataset_id=dt.id;"""
-      LOG.debug(f"QUERY to fetch special datasets access levels info: {query}")
-      statement = await connection.prepare(query)
-      db_response =  await statement.fetch()
+      LOG.debug("QUERY to fetch special datasets access levels info: %s", query)
+      db_response = await connection.fetch(query)
     except Exception as e:
       raise BeaconServerError(f'Query special access levels datasets DB error: {e}') 
     
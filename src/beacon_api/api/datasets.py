@@ -54,13 +54,9 @@ async def fetch_datasets(db_pool):
                 query = """SELECT *
                            FROM beacon_dataset_table;
                            """
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch()
-                datasets_list = []
-                if db_response:
-                    for record in list(db_response):
-                        datasets_list.append(shape_dataset(dict(record)))
-                return datasets_list
+                db_response = await connection.fetch(query)
+                # asyncpg already returns a list, shape it in a single pass
+                return [shape_dataset(dict(record)) for record in db_response]
             except Exception as e:
                 raise BeaconServerError(f'Query metadata DB error: {e}')
 
@@ -26,12 +26,9 @@ async def fetch_filtering_terms(db_pool):
                 query = """SELECT ontology, term, label
                            FROM ontology_term;
                            """
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch()
-                filtering_terms_list = []
-                for record in list(db_response):
-                    filtering_terms_list.append(dict(record))
-                return filtering_terms_list
+                db_response = await connection.fetch(query)
+                # asyncpg already returns a list, transform it in a single pass
+                return [dict(record) for record in db_response]
             except Exception as e:
                 raise BeaconServerError(f'Query metadata DB error: {e}')
 
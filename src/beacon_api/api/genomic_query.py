@@ -15,7 +15,7 @@ from .exceptions import BeaconBadRequest, BeaconServerError, BeaconForbidden, Be
 from .. import __apiVersion__, __id__
 from ..conf.config import DB_SCHEMA
 
-from ..utils.polyvalent_functions import create_prepstmt_variables, filter_exists, datasetHandover
+from ..utils.polyvalent_functions import create_prepstmt_variables, filter_exists, datasetHandover, request2queryparameters
 from ..utils.polyvalent_functions import prepare_filter_parameter, parse_filters_request
 from ..utils.polyvalent_functions import fetch_datasets_access, access_resolution
 
@@ -26,64 +26,97 @@ from ..utils.models import variant_object, variantAnnotation_object
 
 LOG = logging.getLogger(__name__)
 
+# Static parts of the beacon response, built once at import time instead of on
+# every request (filter_response never mutates them, it copies references)
+RESPONSE_META = {
+    "Variant": ["beacon-variant-v0.1", "ga4gh-variant-representation-v0.1"],
+    "VariantAnnotation": ["beacon-variant-annotation-v1.0"],
+    "VariantMetadata": ["beacon-variant-metadata-v1.0"]
+}
+
+BEACON_HANDOVER = [ { "handoverType" : {
+                        "id" : "CUSTOM",
+                        "label" : "Organization contact"
+                        },
+                        "note" : "Organization contact details maintaining this Beacon",
+                        "url" : "mailto:beacon.ega@crg.eu"
+                    } ]
+
+# The SQL function call never changes (13 placeholders), so the statement is
+# built once at import time instead of on every request
+HITS_QUERY = f"""SELECT * FROM {DB_SCHEMA}.query_data_response({create_prepstmt_variables(13)});"""
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 #                                         FORMATTING
 # ----------------------------------------------------------------------------------------------------------------------
 
+# Static skeleton of a dataset response, built once so the transform functions
+# only have to fill in the fields that actually come from the record
+MISS_RESPONSE_TEMPLATE = {
+    "datasetId": "",
+    "internalId": None,
+    "exists": False,
+    "variantCount": 0,
+    "callCount": 0,
+    "sampleCount": 0,
+    "frequency": 0,
+    "numVariants": 0,
+    "info": None,
+    "datasetHandover": None,
+}
+
+
 async def transform_record(db_pool, record):
     """Format the record we got from the database to adhere to the response schema."""
+    # Convert the record to a dict only once and reuse it
+    response = dict(record)
 
     # Before creating the dict, we want to get the stable_id frm the DB
     async with db_pool.acquire(timeout=180) as connection:
-        try: 
-            query = f"""SELECT stable_id, access_type
+        try:
+            # Parameterized so the same statement is reused from the cache for every dataset
+            query = """SELECT stable_id, access_type
                         FROM beacon_dataset
-                        WHERE id={dict(record).get("dataset_id")};
+                        WHERE id=$1;
                         """
-            statement = await connection.prepare(query)
-            extra_record = await statement.fetchrow()
+            extra_record = await connection.fetchrow(query, response.get("dataset_id"))
         except Exception as e:
-            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}') 
+            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}')
 
-    response = dict(record)
+    extra_response = dict(extra_record)
 
     for dispensable in ["id", "variant_id", "variant_composite_id", "chromosome", "reference", "alternate", "start", "end", "variant_type"]:
         response.pop(dispensable)
 
-    dataset_name = dict(extra_record).pop("stable_id")   
+    dataset_name = extra_response.get("stable_id")
     response["datasetId"] = dataset_name
     response["internalId"] = response.pop("dataset_id")
     response["exists"] = True
-    response["variantCount"] = response.pop("variant_cnt")  
-    response["callCount"] = response.pop("call_cnt") 
-    response["sampleCount"] = response.pop("sample_cnt") 
+    response["variantCount"] = response.pop("variant_cnt")
+    response["callCount"] = response.pop("call_cnt")
+    response["sampleCount"] = response.pop("sample_cnt")
     response["frequency"] = 0 if response.get("frequency") is None else float(response.pop("frequency"))
     response["numVariants"] = 0 if response.get("num_variants") is None else response.pop("num_variants")
-    response["info"] = {"accessType": dict(extra_record).pop("access_type"),
+    response["info"] = {"accessType": extra_response.get("access_type"),
                         "matchingSampleCount": 0 if response.get("matching_sample_cnt") is None else response.pop("matching_sample_cnt")}
     response["datasetHandover"] = datasetHandover(dataset_name)
-    
+
     return response
 
 
 def transform_misses(record):
     """Format the missed datasets record we got from the database to adhere to the response schema."""
-    response = {}
-
-    dataset_name = dict(record).get("stableId") 
-
-    response["datasetId"] = dataset_name 
-    response["internalId"] = dict(record).get("datasetId")
-    response["exists"] = False
-    # response["datasetId"] = ''  
-    response["variantCount"] = 0
-    response["callCount"] = 0
-    response["sampleCount"] = 0
-    response["frequency"] = 0 
-    response["numVariants"] = 0 
-    response["info"] = {"accessType": dict(record).get("accessType"),
-                        "matchingSampleCount": 0 }
+
+    # Copy the prebuilt skeleton and only fill in the record-dependent fields
+    response = dict(MISS_RESPONSE_TEMPLATE)
+    record_dict = dict(record)
+
+    dataset_name = record_dict.get("stableId")
+    response["datasetId"] = dataset_name
+    response["internalId"] = record_dict.get("datasetId")
+    response["info"] = {"accessType": record_dict.get("accessType"),
+                        "matchingSampleCount": 0}
     response["datasetHandover"] = datasetHandover(dataset_name)
     return response
 
@@ -103,8 +136,7 @@ async def fetch_resulting_datasets(db_pool, query_parameters, misses=False, acce
     Returns list of datasets dictionaries. 
     """
     async with db_pool.acquire(timeout=180) as connection:
-        datasets = []
-        try: 
+        try:
             if misses:
                 if accessible_missing:
                     query = f"""SELECT id as "datasetId", access_type as "accessType", stable_id as "stableId"
@@ -112,19 +144,19 @@ async def fetch_resulting_datasets(db_pool, query_parameters, misses=False, acce
                                 WHERE id IN ({create_prepstmt_variables(len(accessible_missing))});
                                 """
                     # LOG.debug(f"QUERY to fetch accessible missing info: {query}")
-                    statement = await connection.prepare(query)
-                    db_response =  await statement.fetch(*accessible_missing)
+                    db_response = await connection.fetch(query, *accessible_missing)
                 else:
                     return []
-            else:
-                query = f"""SELECT * FROM {DB_SCHEMA}.query_data_response({create_prepstmt_variables(13)});"""
-                LOG.debug(f"QUERY to fetch hits: {query}")
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch(*query_parameters)         
-
-            for record in list(db_response):
-                processed = transform_misses(record) if misses else record
-                datasets.append(processed)
+                # asyncpg already returns a list, transform it in a single pass
+                return [transform_misses(record) for record in db_response]
+
+            LOG.debug("QUERY to fetch hits: %s", HITS_QUERY)
+            # Stream the hits with a server-side cursor so big result sets are
+            # fetched in batches instead of one big protocol buffer
+            datasets = []
+            async with connection.transaction():
+                async for record in connection.cursor(HITS_QUERY, *query_parameters, prefetch=500):
+                    datasets.append(record)
             return datasets
         except Exception as e:
                 raise BeaconServerError(f'Query resulting datasets DB error: {e}') 
@@ -167,17 +199,19 @@ async def get_datasets(db_pool, query_parameters, include_dataset, processed_req
 
     # If  the includeDatasets option is ALL or MISS we have to "create" the miss datasets (which will be tranformed also) and join them to the datasetAlleleResponses
     if include_dataset in ['ALL', 'MISS']:
+        # The requested ids do not change per variant, convert them only once
+        list_all = [int(x) for x in dataset_ids.split(",")]
         for variant in variants_dict:
-            list_hits = [record["internalId"] for record in variants_dict[variant]["datasetAlleleResponses"]]
-            list_all = list(map(int, dataset_ids.split(",")))
-            accessible_missing = [int(x) for x in list_all if x not in list_hits]
+            # a set makes the membership check below constant time
+            hit_ids = {record["internalId"] for record in variants_dict[variant]["datasetAlleleResponses"]}
+            accessible_missing = [x for x in list_all if x not in hit_ids]
             miss_datasets = await fetch_resulting_datasets(db_pool, query_parameters, misses=True, accessible_missing=accessible_missing)
             variants_dict[variant]["datasetAlleleResponses"] += miss_datasets
 
     # Finally, we iterate the variants_dict to create the response
     response = []
     for variant in variants_dict:
-        rsID, cellBase_dict, dbSNP_dict = await fetch_variantAnnotations(variants_dict[variant]["variantDetails"])
+        rsID, cellBase_dict, dbSNP_dict = fetch_variantAnnotations(variants_dict[variant]["variantDetails"])
         if rsID: variants_dict[variant]["variantDetails"]["variantId"] = rsID
         datasetAlleleResponses = filter_exists(include_dataset, variants_dict[variant]["datasetAlleleResponses"])
         final_variantsFound_element = {
@@ -206,48 +240,17 @@ async def genomic_request_handler(db_pool, processed_request, request):
     main queries and prepare the response object. 
     """
     # First we parse the query to prepare it to be used in the SQL function
-    # We create a list of the parameters that the SQL function needs
-    correct_parameters =  [
-	"variantType",
-	"start",
-	"startMin",
-	"startMax",
-	"end",
-	"endMin",
-	"endMax",
-	"referenceName",
-	"referenceBases",
-	"alternateBases",
-	"assemblyId",
-	"datasetIds",
-    "filters"]
-    
-    int_params = ['start', 'end', 'endMax', 'endMin', 'startMax', 'startMin']
-
-    query_parameters = []
-
-    # Iterate correct_parameters to create the query_parameters list from the processed_request 
-    # in the requiered order and with the right types
-    for param in correct_parameters:
-        query_param = processed_request.get(param)
-        if query_param:
-            if param in int_params:
-                query_parameters.append(int(query_param))
-            else:
-                query_parameters.append(str(query_param))
-        else:
-            if param in int_params:
-                query_parameters.append(None)
-            else:
-                query_parameters.append("null")
-
+    # We create the list of the parameters that the SQL function needs in the
+    # required order and with the right types (see QUERY_PARAMETERS_TABLE)
+    query_parameters = request2queryparameters(processed_request)
 
-    # At this point we have a list with the needed parameters called query_parameters, the only thing 
+    # At this point we have a list with the needed parameters called query_parameters, the only thing
     # laking is to update the datasetsIds (it can be "null" or processed_request.get("datasetIds"))
 
-    LOG.debug(f"Correct param: {correct_parameters}")
-    LOG.debug(f"Query param: {query_parameters}")
-    LOG.debug(f"Query param types: {[type(x) for x in query_parameters]}")
+    LOG.debug("Query param: %s", query_parameters)
+    # The type list is only worth building when debug logging is actually on
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Query param types: %s", [type(x) for x in query_parameters])
 
     # We want to get a list of the datasets available in the database separated in three lists
     # depending on the access level (we check all of them if the user hasn't specified anything, if some
@@ -278,7 +281,7 @@ async def genomic_request_handler(db_pool, processed_request, request):
     else:
         include_dataset  = "ALL"
 
-    LOG.info(f"Query FINAL param: {query_parameters}")
+    LOG.info("Query FINAL param: %s", query_parameters)
     LOG.info('Connecting to the DB to make the query.')
 
     variantsFound = await get_datasets(db_pool, query_parameters, include_dataset, processed_request)
@@ -297,14 +300,10 @@ async def genomic_request_handler(db_pool, processed_request, request):
 
     # We create the final dictionary with all the info we want to return
     beacon_response = {
-                    "meta": {
-                        "Variant": ["beacon-variant-v0.1", "ga4gh-variant-representation-v0.1"],
-  	                    "VariantAnnotation": ["beacon-variant-annotation-v1.0"],
-                        "VariantMetadata": ["beacon-variant-metadata-v1.0"]
-                    },
+                    "meta": RESPONSE_META,
                     "value": { 'beaconId': __id__,
                         'apiVersion': __apiVersion__,
-                        'exists': any([dataset['exists'] for variant in variantsFound for dataset in variant["datasetAlleleResponses"]]),
+                        'exists': any(dataset['exists'] for variant in variantsFound for dataset in variant["datasetAlleleResponses"]),
                         'request': { "meta": { "request": {
                                                             "Variant": ["beacon-variant-v0.1"]  + variant,
                                                             "VariantAnnotation": ["beacon-variant-annotation-v1.0"] + variantAnnotation,
@@ -317,14 +316,7 @@ async def genomic_request_handler(db_pool, processed_request, request):
                         'variantsFound': variantsFound,
                         'info': None,
                         'resultsHandover': None,
-                        'beaconHandover': [ { "handoverType" : {
-                                                "id" : "CUSTOM",
-                                                "label" : "Organization contact"
-                                                },
-                                                "note" : "Organization contact details maintaining this Beacon",
-                                                "url" : "mailto:beacon.ega@crg.eu"
-                                            } ]
-                        
+                        'beaconHandover': BEACON_HANDOVER
                         }
                     }
 
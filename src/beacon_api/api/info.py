@@ -12,6 +12,7 @@ and their associated metadata.
 .. note:: See ``beacon_api`` root folder ``__init__.py``  and  ``/utils/models.py`` for changing values used here.
 """
 
+import json
 import logging
 
 from .. import __id__, __beacon_name__, __apiVersion__, __org_id__, __org_name__, __org_description__, __org_adress__, __org_welcomeUrl__, __org_contactUrl__, __org_logoUrl__, __org_info__
@@ -27,31 +28,16 @@ from ..utils.translate2accesslevels import info2access
 
 LOG = logging.getLogger(__name__)
 
-
-# ----------------------------------------------------------------------------------------------------------------------
-#                                         FORMATTING
-# ----------------------------------------------------------------------------------------------------------------------
-
-def transform_metadata(record):
-    """Format the metadata record we got from the database to adhere to the response schema."""
-    response = dict(record)
-
-    response["id"] = response.pop("datasetId")  
-    response["name"] = None
-    response["description"] = response.pop("description")
-    response["assemblyId"] = response.pop("assemblyId")  
-    response["createDateTime"] = None 
-    response["updateDateTime"] = None
-    response["dataUseConditions"] = None
-    response["version"] = None
-    response["variantCount"] = 0 if response.get("variantCount") is None else response.get("variantCount")
-    response["callCount"] = 0 if response.get("callCount") is None else response.get("callCount")
-    response["sampleCount"] = 0 if response.get("sampleCount") is None else response.get("sampleCount")
-    response["externalURL"] = None
-    response["info"] = {"accessType": response.get("accessType"),
-                        "authorized": 'true' if response.pop("accessType") == "PUBLIC" else 'false'}  
-
-    return response
+# jsonb_agg projection shared by every filter combination of fetch_dataset_metadata
+METADATA_SELECT = """SELECT jsonb_agg(jsonb_build_object(
+                     'id', stable_id, 'name', null, 'description', description,
+                     'assemblyId', reference_genome, 'createDateTime', null, 'updateDateTime', null,
+                     'dataUseConditions', null, 'version', null,
+                     'variantCount', coalesce(variant_cnt, 0), 'callCount', coalesce(call_cnt, 0),
+                     'sampleCount', coalesce(sample_cnt, 0), 'externalURL', null,
+                     'info', jsonb_build_object('accessType', access_type,
+                                                'authorized', case when access_type = 'PUBLIC' then 'true' else 'false' end)))
+                     FROM beacon_dataset"""
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -62,31 +48,37 @@ async def fetch_dataset_metadata(db_pool, datasets=None, access_type=None):
     """
     Execute query for returning dataset metadata.
 
-    Returns a list of datasets metadata dictionaries. 
+    Postgres shapes each dataset with ``jsonb_build_object`` and aggregates them
+    with ``jsonb_agg``, so a single value comes back instead of one row per
+    dataset that Python would have to reshape.
+
+    Returns a list of datasets metadata dictionaries.
     """
     # Take one connection from the database pool
     async with db_pool.acquire(timeout=180) as connection:
         # Start a new session with the connection
         async with connection.transaction():
             # Fetch dataset metadata according to user request
-            datasets_query = None if not datasets else datasets
-            access_query = None if not access_type else access_type
             try:
-
-                query = """SELECT stable_id as "datasetId", description as "description", access_type as "accessType",
-                           reference_genome as "assemblyId", variant_cnt as "variantCount",
-                           call_cnt as "callCount", sample_cnt as "sampleCount"
-                           FROM beacon_dataset WHERE
-                           coalesce(stable_id = any($1::varchar[]), true)
-                           AND coalesce(access_type = any($2::varchar[]), true);
-                           """
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch(datasets_query, access_query)
-                metadata = []
-                LOG.info(f"Showing the INFO endpoint.")
-                for record in list(db_response):
-                    metadata.append(transform_metadata(record))
-                return metadata
+                # Only add the WHERE clauses that are actually needed: plain
+                # equality filters (instead of coalesce(..., true)) let
+                # Postgres use the indexes when filters are supplied
+                query = METADATA_SELECT
+                query_args = []
+                conditions = []
+                if datasets:
+                    query_args.append(datasets)
+                    conditions.append(f"stable_id = any(${len(query_args)}::varchar[])")
+                if access_type:
+                    query_args.append(access_type)
+                    conditions.append(f"access_type = any(${len(query_args)}::varchar[])")
+                if conditions:
+                    query += " WHERE " + " AND ".join(conditions)
+
+                db_response = await connection.fetchval(query, *query_args)
+                LOG.info("Showing the INFO endpoint.")
+                # jsonb_agg returns NULL when no dataset matches
+                return json.loads(db_response) if db_response else []
             except Exception as e:
                 raise BeaconServerError(f'Query metadata DB error: {e}')
 
@@ -111,24 +103,26 @@ async def info_handler(request, processed_request, pool, info_endpoint=False, se
 
     # Decide whether the Beacon_v1 or the GA4GH spec is used (while validating the model parameter)
     # if info, then check the parameter model, if it is passed fine then use GA4GH model, if not, use the default model, which is Beacon-v1
+    # NOTE the models are cached per host, so we work on a shallow copy before
+    # adding the request-dependent keys below
     if info_endpoint:
         if not processed_request:
             LOG.info('Using Beacon API Specification format for Service Info.')
-            beacon_info = Beacon_v1(request.host)
+            beacon_info = dict(Beacon_v1(request.host))
         elif processed_request.get("model") and processed_request.get("model") == 'GA4GH-ServiceInfo-v0.1':
             LOG.info('Using GA4GH Discovery format for Service Info.')
-            beacon_info = GA4GH_ServiceInfo_v01(request.host)
+            beacon_info = dict(GA4GH_ServiceInfo_v01(request.host))
         else:
             error = "The info endpoint only accepts 'model' as parameter with 'GA4GH-ServiceInfo-v0.1' as value."
             raise BeaconBasicBadRequest(processed_request, request.host, error)
     # if there is service_info then use ga4gh
     elif service_info:
         LOG.info('Using GA4GH Discovery format for Service Info.')
-        beacon_info = GA4GH_ServiceInfo_v01(request.host)
+        beacon_info = dict(GA4GH_ServiceInfo_v01(request.host))
     # if there is no info, the default model
     else:
         LOG.info('Using Beacon API Specification format for Service Info.')
-        beacon_info = Beacon_v1(request.host)
+        beacon_info = dict(Beacon_v1(request.host))
 
     beacon_info.update({'datasets': beacon_dataset,
                         # If one sets up a beacon it is recommended to adjust these sample requests
@@ -152,13 +146,8 @@ async def info_handler(request, processed_request, pool, info_endpoint=False, se
 #                                         COHORTS HANDLER FUNCTION
 # ----------------------------------------------------------------------------------------------------------------------
 
-async def cohorts_handler(request, processed_request):
-    """
-    Construct the `Beacon` cohort information dict.
-
-    Returns the cohort response dictionary. 
-    """
-
+def _build_cohorts_response():
+    """Build the cohorts response once, the cohorts JSON is fixed at import time."""
     ncohorts = 0
     cohorts_as_list = []
     if __cohorts_json__:
@@ -206,3 +195,17 @@ async def cohorts_handler(request, processed_request):
 
     response["response"] = cohorts_response
     return response
+
+
+# The cohorts configuration cannot change while the server runs, so the full
+# response is ready before the first request comes in
+COHORTS_RESPONSE = _build_cohorts_response()
+
+
+async def cohorts_handler(request, processed_request):
+    """
+    Construct the `Beacon` cohort information dict.
+
+    Returns the cohort response dictionary.
+    """
+    return COHORTS_RESPONSE
@@ -16,7 +16,7 @@ from .exceptions import BeaconBadRequest, BeaconServerError, BeaconForbidden, Be
 from .. import __apiVersion__, __id__
 from ..conf.config import DB_SCHEMA
 
-from ..utils.polyvalent_functions import create_prepstmt_variables, filter_exists
+from ..utils.polyvalent_functions import create_prepstmt_variables, filter_exists, request2queryparameters
 from ..utils.polyvalent_functions import prepare_filter_parameter, parse_filters_request
 from ..utils.polyvalent_functions import fetch_datasets_access, access_resolution
 
@@ -26,56 +26,73 @@ from ..utils.translate2accesslevels import query2access
 
 LOG = logging.getLogger(__name__)
 
+# The SQL function call never changes (13 placeholders), so the statement is
+# built once at import time instead of on every request
+HITS_QUERY = f"""SELECT * FROM {DB_SCHEMA}.query_data_summary_response({create_prepstmt_variables(13)});"""
+
 
 # ----------------------------------------------------------------------------------------------------------------------
 #                                         FORMATTING
 # ----------------------------------------------------------------------------------------------------------------------
 
+# Static skeleton of a dataset response, built once so the transform functions
+# only have to fill in the fields that actually come from the record
+MISS_RESPONSE_TEMPLATE = {
+    "datasetId": "",
+    "internalId": None,
+    "exists": False,
+    "variantCount": 0,
+    "callCount": 0,
+    "sampleCount": 0,
+    "frequency": 0,
+    "numVariants": 0,
+    "info": None,
+}
+
+
 async def transform_record(db_pool, record):
     """Format the record we got from the database to adhere to the response schema."""
+    # Convert the record to a dict only once and reuse it
+    response = dict(record)
 
     # Before creating the dict, we want to get the stable_id frm the DB
     async with db_pool.acquire(timeout=180) as connection:
-        try: 
-            query = f"""SELECT stable_id, access_type
+        try:
+            # Parameterized so the same statement is reused from the cache for every dataset
+            query = """SELECT stable_id, access_type
                         FROM beacon_dataset
-                        WHERE id={dict(record).pop("dataset_id")};
+                        WHERE id=$1;
                         """
-            statement = await connection.prepare(query)
-            extra_record = await statement.fetchrow()
+            extra_record = await connection.fetchrow(query, response.get("dataset_id"))
         except Exception as e:
-            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}') 
+            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}')
 
-    response = dict(record)
+    extra_response = dict(extra_record)
 
     response.pop("id")
-    response["datasetId"] = dict(extra_record).pop("stable_id")  
+    response["datasetId"] = extra_response.get("stable_id")
     response["internalId"] = response.pop("dataset_id")
     response["exists"] = True
-    response["variantCount"] = response.pop("variant_cnt")  
-    response["callCount"] = response.pop("call_cnt") 
-    response["sampleCount"] = response.pop("sample_cnt") 
+    response["variantCount"] = response.pop("variant_cnt")
+    response["callCount"] = response.pop("call_cnt")
+    response["sampleCount"] = response.pop("sample_cnt")
     response["frequency"] = 0 if response.get("frequency") is None else float(response.pop("frequency"))
     response["numVariants"] = 0 if response.get("num_variants") is None else response.pop("num_variants")
-    response["info"] = {"access_type": dict(extra_record).pop("access_type")}   
-    
+    response["info"] = {"access_type": extra_response.get("access_type")}
+
     return response
 
 
 def transform_misses(record):
     """Format the missed datasets record we got from the database to adhere to the response schema."""
-    
-    response = {}
-    response["datasetId"] = dict(record).get("stableId")  
-    response["internalId"] = dict(record).get("datasetId")
-    response["exists"] = False
-    # response["datasetId"] = ''  
-    response["variantCount"] = 0
-    response["callCount"] = 0
-    response["sampleCount"] = 0
-    response["frequency"] = 0 
-    response["numVariants"] = 0 
-    response["info"] = {"access_type": dict(record).get("accessType")}
+
+    # Copy the prebuilt skeleton and only fill in the record-dependent fields
+    response = dict(MISS_RESPONSE_TEMPLATE)
+    record_dict = dict(record)
+
+    response["datasetId"] = record_dict.get("stableId")
+    response["internalId"] = record_dict.get("datasetId")
+    response["info"] = {"access_type": record_dict.get("accessType")}
 
     return response
 
@@ -95,8 +112,7 @@ async def fetch_resulting_datasets(db_pool, query_parameters, misses=False, acce
     Returns list of datasets dictionaries. 
     """
     async with db_pool.acquire(timeout=180) as connection:
-        datasets = []
-        try: 
+        try:
             if misses:
                 if accessible_missing:
                     query = f"""SELECT id as "datasetId", access_type as "accessType", stable_id as "stableId"
@@ -104,20 +120,17 @@ async def fetch_resulting_datasets(db_pool, query_parameters, misses=False, acce
                                 WHERE id IN ({create_prepstmt_variables(len(accessible_missing))});
                                 """
                     # LOG.debug(f"QUERY to fetch accessible missing info: {query}")
-                    statement = await connection.prepare(query)
-                    db_response =  await statement.fetch(*accessible_missing)
+                    db_response = await connection.fetch(query, *accessible_missing)
                 else:
                     return []
             else:
-                query = f"""SELECT * FROM {DB_SCHEMA}.query_data_summary_response({create_prepstmt_variables(13)});"""
-                LOG.debug(f"QUERY to fetch hits: {query}")
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch(*query_parameters)         
-
-            for record in list(db_response):
-                processed = transform_misses(record) if misses else await transform_record(db_pool, record)
-                datasets.append(processed)
-            return datasets
+                LOG.debug("QUERY to fetch hits: %s", HITS_QUERY)
+                db_response = await connection.fetch(HITS_QUERY, *query_parameters)
+
+            # asyncpg already returns a list, transform it in a single pass
+            if misses:
+                return [transform_misses(record) for record in db_response]
+            return [await transform_record(db_pool, record) for record in db_response]
         except Exception as e:
                 raise BeaconServerError(f'Query resulting datasets DB error: {e}') 
 
@@ -134,17 +147,18 @@ async def get_datasets(db_pool, query_parameters, include_dataset):
 
     # Fetch datasets where the variant is found
     hit_datasets = await fetch_resulting_datasets(db_pool, query_parameters)
-    LOG.debug(f"hit_datasets: {hit_datasets}")
+    LOG.debug("hit_datasets: %s", hit_datasets)
 
     # If the response has to include the datasets where the variant is not found, 
     # we want to fetch info about them and shape them to be shown
     if include_dataset in ['ALL', 'MISS']:
-        list_all = list(map(int, dataset_ids.split(",")))
-        LOG.debug(f"list_all: {list_all}")
-        list_hits  =  [dict["internalId"] for dict in hit_datasets]
-        LOG.debug(f"list_hits: {list_hits}")
-        accessible_missing = [int(x) for x in list_all if x not in list_hits]
-        LOG.debug(f"accessible_missing: {accessible_missing}")
+        list_all = [int(x) for x in dataset_ids.split(",")]
+        LOG.debug("list_all: %s", list_all)
+        # a set makes the membership check below constant time
+        hit_ids = {dataset["internalId"] for dataset in hit_datasets}
+        LOG.debug("hit_ids: %s", hit_ids)
+        accessible_missing = [x for x in list_all if x not in hit_ids]
+        LOG.debug("accessible_missing: %s", accessible_missing)
         miss_datasets = await fetch_resulting_datasets(db_pool, query_parameters, misses=True, accessible_missing=accessible_missing)
     response = hit_datasets + miss_datasets
     return response
@@ -162,49 +176,18 @@ async def query_request_handler(db_pool, processed_request, request):
     main queries and prepare the response object. 
     """
     # First we parse the query to prepare it to be used in the SQL function
-    # We create the list of the parameters that the SQL function needs
-    correct_parameters =  [
-	"variantType",
-	"start",
-	"startMin",
-	"startMax",
-	"end",
-	"endMin",
-	"endMax",
-	"referenceName",
-	"referenceBases",
-	"alternateBases",
-	"assemblyId",
-	"datasetIds",
-    "filters"]
-    
-    int_params = ['start', 'end', 'endMax', 'endMin', 'startMax', 'startMin']
-
-    query_parameters = []
-
-    # Iterate correct_parameters to create the query_parameters list from the processed_request 
-    # in the requiered order and with the right types
-    for param in correct_parameters:
-        query_param = processed_request.get(param)
-        if query_param:
-            if param in int_params:
-                query_parameters.append(int(query_param))
-            else:
-                query_parameters.append(str(query_param))
-        else:
-            if param in int_params:
-                query_parameters.append(None)
-            else:
-                query_parameters.append("null")
-
+    # We create the list of the parameters that the SQL function needs in the
+    # required order and with the right types (see QUERY_PARAMETERS_TABLE)
+    query_parameters = request2queryparameters(processed_request)
 
-    # At this point we have a list with the needed parameters called query_parameters, the only thing 
+    # At this point we have a list with the needed parameters called query_parameters, the only thing
     # laking is to update the datasetsIds (it can be "null" or processed_request.get("datasetIds"))
     # then we have to take into account the access permissions
 
-    LOG.debug(f"Correct param: {correct_parameters}")
-    LOG.debug(f"Query param: {query_parameters}")
-    LOG.debug(f"Query param types: {[type(x) for x in query_parameters]}")
+    LOG.debug("Query param: %s", query_parameters)
+    # The type list is only worth building when debug logging is actually on
+    if LOG.isEnabledFor(logging.DEBUG):
+        LOG.debug("Query param types: %s", [type(x) for x in query_parameters])
 
     # We want to get a list of the datasets available in the database separated in three lists
     # depending on the access level (we check all of them if the user hasn't specified anything, if some
@@ -234,7 +217,7 @@ async def query_request_handler(db_pool, processed_request, request):
     else:
         include_dataset  = "ALL"
 
-    LOG.info(f"Query FINAL param: {query_parameters}")
+    LOG.info("Query FINAL param: %s", query_parameters)
     LOG.info('Connecting to the DB to make the query.')
 
     datasets = await get_datasets(db_pool, query_parameters, include_dataset)
@@ -244,7 +227,7 @@ async def query_request_handler(db_pool, processed_request, request):
     # We create the final dictionary with all the info we want to return
     beacon_response = { 'beaconId': __id__,
                         'apiVersion': __apiVersion__,
-                        'exists': any([x['exists'] for x in datasets]),
+                        'exists': any(x['exists'] for x in datasets),
                         'info': None,
                         'alleleRequest': processed_request,
                         'datasetAlleleResponses': filter_exists(include_dataset, datasets)}
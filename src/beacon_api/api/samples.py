@@ -34,20 +34,20 @@ LOG = logging.getLogger(__name__)
 
 async def transform_record(db_pool, record):
     """Format the record we got from the database to adhere to the response schema."""
+    # Convert the record to a dict only once and reuse it
+    response = dict(record)
 
     # Before creating the dict, we want to get the stable_id frm the DB
     async with db_pool.acquire(timeout=180) as connection:
-        try: 
-            query = f"""SELECT stable_id, access_type
+        try:
+            # Parameterized so the same statement is reused from the cache for every dataset
+            query = """SELECT stable_id, access_type
                         FROM beacon_dataset
-                        WHERE id={dict(record).get("dataset_id")};
+                        WHERE id=$1;
                         """
-            statement = await connection.prepare(query)
-            extra_record = await statement.fetchrow()
+            extra_record = await connection.fetchrow(query, response.get("dataset_id"))
         except Exception as e:
-            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}') 
-
-    response = dict(record)
+            raise BeaconServerError(f'Query metadata (stableID) DB error: {e}')
 
     for dispensable in ["id", "variant_id", "chromosome", "reference", "alternate", "start", "end", "unique_id", "sv_length"]:
         if response.get(dispensable):
@@ -127,9 +127,8 @@ async def fetch_target_variant(db_pool, processed_request, valid_datasets):
                             END);
                         """
                     
-            LOG.debug(f"QUERY target variant(s): {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY target variant(s): %s", query)
+            db_response = await connection.fetch(query)
 
         except Exception as e:
             raise BeaconServerError(f'Query target variant(s) DB error: {e}')
@@ -149,9 +148,8 @@ async def get_datasetspersample(db_pool, sample_id):
             query  = f"""SELECT dataset_id FROM {DB_SCHEMA}.beacon_dataset_sample_table
 	                        WHERE sample_id = {sample_id};"""
 
-            LOG.debug(f"QUERY datasets list per sample: {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY datasets list per sample: %s", query)
+            db_response = await connection.fetch(query)
 
             for record in list(db_response):
                 datasets_list.append(record['dataset_id'])
@@ -201,8 +199,8 @@ async def create_variantsFound(db_pool, processed_request, records_list, valid_d
     for record in variant_records:
         variant_identifier = record["unique_id"]
 
-        LOG.debug(f"variant_identifier: {variant_identifier}")
-        LOG.debug(f"record: {record}")
+        LOG.debug("variant_identifier: %s", variant_identifier)
+        LOG.debug("record: %s", record)
         
         variants_dict[variant_identifier] = {}
         variants_dict[variant_identifier]["variantDetails"] = {
@@ -231,9 +229,8 @@ async def create_variantsFound(db_pool, processed_request, records_list, valid_d
                 #                 WHERE dataset_id IN ({dataset_ids}) 
                 #                 AND unique_id = '{variant_identifier}';"""
 
-                LOG.debug(f"QUERY datasets info per variant: {query}")
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch()
+                LOG.debug("QUERY datasets info per variant: %s", query)
+                db_response = await connection.fetch(query)
 
                 for record in list(db_response):
                     variants_dict[variant_identifier]["datasetAlleleResponses"].append(await transform_record(db_pool, record))
@@ -255,7 +252,7 @@ async def create_variantsFound(db_pool, processed_request, records_list, valid_d
     # Finally, we iterate the variants_dict to create the response
     response = []
     for variant in variants_dict:
-        rsID, cellBase_dict, dbSNP_dict = await fetch_variantAnnotations(variants_dict[variant]["variantDetails"])
+        rsID, cellBase_dict, dbSNP_dict = fetch_variantAnnotations(variants_dict[variant]["variantDetails"])
         if rsID: variants_dict[variant]["variantDetails"]["variantId"] = rsID
         datasetAlleleResponses = filter_exists(include_dataset, variants_dict[variant]["datasetAlleleResponses"])
         final_variantsFound_element = {
@@ -293,9 +290,8 @@ async def get_valid_datasets(db_pool, dataset_filters):
                             FROM beacon_dataset_table;"""
 
 
-            LOG.debug(f"QUERY valid datasets: {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY valid datasets: %s", query)
+            db_response = await connection.fetch(query)
 
             for record in list(db_response):
                 id_list.append(dict(record).get("id"))
@@ -344,9 +340,8 @@ async def variant_filter(db_pool, processed_request, valid_datasets, sample):
                             END)
                         LIMIT 5;
                         """
-            LOG.debug(f"QUERY presence variant in sample: {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY presence variant in sample: %s", query)
+            db_response = await connection.fetch(query)
 
         except Exception as e:
             raise BeaconServerError(f'Query filtered samples DB error: {e}')
@@ -385,9 +380,8 @@ async def join_data2sample(db_pool, samples_dict, valid_datasets, processed_requ
                                 ON d.dataset_id = c.dataset_id WHERE d.dataset_id IN ({valid_datasets}) 
                                 AND sample_id = {key};"""
 
-                    LOG.debug(f"QUERY variants per sample: {query}")
-                    statement = await connection.prepare(query)
-                    db_response = await statement.fetch()
+                    LOG.debug("QUERY variants per sample: %s", query)
+                    db_response = await connection.fetch(query)
 
                     for record in list(db_response):
                         filtered_samples_dict[key]["variants"].append(dict(record))
@@ -434,9 +428,8 @@ async def get_samples(db_pool, filters_dict):
                         JOIN patient_table p ON s.patient_id = p.id 
                         WHERE (CASE WHEN {sentence_exists} THEN {sentence} ELSE true END) AND s.sex IS NOT NULL;"""
 
-            LOG.debug(f"QUERY samples: {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY samples: %s", query)
+            db_response = await connection.fetch(query)
 
             response = []
             for record in list(db_response):
@@ -554,7 +547,7 @@ async def sample_request_handler(db_pool, processed_request, request):
 
         # Depending on the endpoint, the order changes
         endpoint = request.path
-        LOG.debug(f"Sorting results for the {endpoint} endpoint.")
+        LOG.debug("Sorting results for the %s endpoint.", endpoint)
         if endpoint == '/individuals':
             results.append({"individual": patient_object, "sample": sample_object, "variantsFound": variantsFound_object})
         else:
@@ -584,7 +577,7 @@ async def sample_request_handler(db_pool, processed_request, request):
                     },
                     "value": { 'beaconId': __id__,
                         'apiVersion': __apiVersion__,
-                        'exists': any([dataset['exists'] for result in results for variant in result["variantsFound"] for dataset in variant["datasetAlleleResponses"]]),
+                        'exists': any(dataset['exists'] for result in results for variant in result["variantsFound"] for dataset in variant["datasetAlleleResponses"]),
                         'request': { "meta": { "request": { 
                                                             "Sample": "beacon-sample-v1",
                                                             "Variant": ["beacon-variant-v0.1"]  + variant,
@@ -128,9 +128,8 @@ async def fetch_filtered_services(db_pool, processed_request):
                            service_type IN ({",".join(list_services)})
                            AND version IN ({",".join(version)});
                            """
-                LOG.debug(f"QUERY to fetch services info: {query}")           
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch()
+                LOG.debug("QUERY to fetch services info: %s", query)           
+                db_response = await connection.fetch(query)
             except Exception as e:
                 raise BeaconServerError(f'Query service DB error: {e}')
         elif list_format == 'short': # returns only id, name, serviceURL, ServiceType and open.
@@ -141,9 +140,8 @@ async def fetch_filtered_services(db_pool, processed_request):
                            service_type IN ({",".join(list_services)})
                            AND version IN ({",".join(version)});
                            """
-                LOG.debug(f"QUERY to fetch short services info: {query}")           
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch()
+                LOG.debug("QUERY to fetch short services info: %s", query)           
+                db_response = await connection.fetch(query)
             except Exception as e:
                 raise BeaconServerError(f'Query short service DB error: {e}')
         services = []
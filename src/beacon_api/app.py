@@ -7,7 +7,7 @@ Server was designed with async/await mindset and with at aim at performance.
 import os
 import sys
 import asyncio
-import json
+import ujson
 from aiohttp import web
 import aiohttp_cors
 import logging
@@ -55,7 +55,7 @@ async def beacon_get(request):
         response = await info_handler(request, processed_request, db_pool, info_endpoint=True)
     else:
         response = await info_handler(request, processed_request, db_pool)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 
 @routes.get('/cohorts')
@@ -66,7 +66,7 @@ async def cohort_get(request):
     LOG.info('GET request to the cohorts endpoint.')
     _, processed_request = await parse_basic_request_object(request)
     response = await cohorts_handler(request, processed_request)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -83,9 +83,9 @@ async def beacon_get_query(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await query_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -95,9 +95,9 @@ async def beacon_post_query(request):
     """Find datasets using POST endpoint."""
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await query_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -114,9 +114,9 @@ async def beacon_get_snp(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -126,9 +126,9 @@ async def beacon_post_snp(request):
     """Find datasets using POST endpoint."""
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -145,9 +145,9 @@ async def beacon_get_region(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -157,9 +157,9 @@ async def beacon_post_region(request):
     """Find datasets using POST endpoint."""
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     query_response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(query_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(query_response, content_type='application/json', dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -179,13 +179,13 @@ async def beacon_get_region(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     # if not processed_request.get("end"):
     #     response = await snp_request_handler(db_pool, processed_request, request)
     # else: 
     #     response = await region_request_handler(db_pool, processed_request, request)
     response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -195,13 +195,13 @@ async def beacon_post_region(request):
     """Find datasets using POST endpoint."""
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     # if not processed_request.get("end"):
     #     response = await snp_request_handler(db_pool, processed_request, request)
     # else: 
     #     response = await region_request_handler(db_pool, processed_request, request)
     response = await genomic_request_handler(db_pool, processed_request, request)
-    return web.json_response(response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(response, content_type='application/json', dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -218,10 +218,10 @@ async def beacon_get_samples(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
 
     sample_response = await sample_request_handler(db_pool, processed_request, request)
-    return web.json_response(sample_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(sample_response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -231,10 +231,10 @@ async def beacon_post_samples(request):
     """Find samples using POST endpoint."""
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
 
     sample_response = await sample_request_handler(db_pool, processed_request, request)
-    return web.json_response(sample_response, content_type='application/json', dumps=json.dumps)    
+    return web.json_response(sample_response, content_type='application/json', dumps=ujson.dumps)    
     
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -252,10 +252,10 @@ async def beacon_get_samples(request):
     """
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
 
     sample_response = await sample_request_handler(db_pool, processed_request, request)
-    return web.json_response(sample_response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(sample_response, content_type='application/json', dumps=ujson.dumps)
 
 
 
@@ -264,10 +264,10 @@ async def beacon_get_samples(request):
 async def beacon_post_samples(request):
     db_pool = request.app['pool']
     method, processed_request = await parse_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
 
     sample_response = await sample_request_handler(db_pool, processed_request, request)
-    return web.json_response(sample_response, content_type='application/json', dumps=json.dumps)    
+    return web.json_response(sample_response, content_type='application/json', dumps=ujson.dumps)    
     
 
 
@@ -287,7 +287,7 @@ async def beacon_filtering_terms(request):
     LOG.info('GET request to the filtering_terms endpoint.')
     db_pool = request.app['pool']
     response = await filtering_terms_handler(request.host, db_pool)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -305,9 +305,9 @@ async def beacon_access_levels(request):
     LOG.info('GET request to the access_levels endpoint.')
     db_pool = request.app['pool']
     method, processed_request = await parse_basic_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     response = await access_levels_terms_handler(db_pool, processed_request, request)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 @routes.post('/access_levels')
 @validate_access_levels
@@ -316,9 +316,9 @@ async def beacon_post_access_levels(request):
     LOG.info('POST request to the access_levels endpoint.')
     db_pool = request.app['pool']
     method, processed_request = await parse_basic_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     response = await access_levels_terms_handler(db_pool, processed_request, request)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -336,10 +336,10 @@ async def beacon_get(request):
     LOG.info('GET request to the services endpoint.')
     db_pool = request.app['pool']
     method, processed_request = await parse_basic_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     response = await services_handler(db_pool, processed_request, request)
 
-    return web.json_response(response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(response, content_type='application/json', dumps=ujson.dumps)
 
 @routes.post('/services')
 @validate_services
@@ -352,10 +352,10 @@ async def beacon_get(request):
     LOG.info('POST request to the services endpoint.')
     db_pool = request.app['pool']
     method, processed_request = await parse_basic_request_object(request)
-    LOG.info(f"This is the {method} processed request: {processed_request}")
+    LOG.info("This is the %s processed request: %s", method, processed_request)
     response = await services_handler(db_pool, processed_request, request)
 
-    return web.json_response(response, content_type='application/json', dumps=json.dumps)
+    return web.json_response(response, content_type='application/json', dumps=ujson.dumps)
 
 # ----------------------------------------------------------------------------------------------------------------------
 #                                         DATASET ENDPOINT OPERATIONS
@@ -371,7 +371,7 @@ async def beacon_datasets(request):
     LOG.info('GET request to the datasets endpoint.')
     db_pool = request.app['pool']
     response = await datasets_handler(request.host, db_pool)
-    return web.json_response(response)
+    return web.json_response(response, dumps=ujson.dumps)
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -388,8 +388,7 @@ async def initialize(app):
     async with db_pool.acquire(timeout=180) as connection:
         query = """SELECT 1;
                     """
-        statement = await connection.prepare(query)
-        db_response =  await statement.fetch()
+        db_response = await connection.fetch(query)
     set_cors(app)
     LOG.info("Initialization done.")
 
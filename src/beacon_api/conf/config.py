@@ -9,6 +9,8 @@ We use:
 * ``DATABASE_PASSWORD`` - PostgreSQL user associated password
 * ``DATABASE_NAME`` - PostgreSQL database name/view utilised by the ``elixir_beacon_dev``
 * ``DATABASE_SCHEMA`` - in case a schema is used
+* ``DATABASE_POOL_MIN_SIZE`` - connections kept open while idle (default 0)
+* ``DATABASE_POOL_MAX_SIZE`` - upper bound of concurrent connections (default 20)
 
 The variable is then used to configure the application to connect to that database using asyncpg.
 At this point we also initialize a connection pool that the API is going to use on all its endpoints.
@@ -32,11 +34,16 @@ async def init_db_pool():
                                      # Multiple schemas can be used, and they need to be comma separated
                                      server_settings={'search_path': DB_SCHEMA if DB_SCHEMA else 'public'},
                                      # initializing with 0 connections allows the web server to
-                                     # start and also continue to live
-                                     min_size=0,
-                                     # for now limiting the number of connections in the pool
-                                     max_size=20,
+                                     # start and also continue to live, raise it in deployments
+                                     # that want warm connections ready at startup
+                                     min_size=int(os.environ.get('DATABASE_POOL_MIN_SIZE', 0)),
+                                     # limit the number of connections in the pool, this also caps
+                                     # how many queries the handlers run against Postgres at once
+                                     max_size=int(os.environ.get('DATABASE_POOL_MAX_SIZE', 20)),
                                      max_queries=50000,
+                                     # each pooled connection keeps an LRU cache of prepared
+                                     # statements, so repeated queries skip the PREPARE round-trip
+                                     statement_cache_size=128,
                                      timeout=120,
                                      command_timeout=180,
                                      max_cached_statement_lifetime=0,
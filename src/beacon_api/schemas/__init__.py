@@ -11,10 +11,16 @@ Schemas available:
 
 import os
 import json
+from functools import lru_cache
 
 
+@lru_cache(maxsize=None)
 def load_schema(name):
-    """Load JSON schemas."""
+    """Load JSON schemas.
+
+    The schemas never change while the server runs, so each file is read
+    and parsed only once and the cached dict is shared afterwards.
+    """
     module_path = os.path.dirname(__file__)
     path = os.path.join(module_path, '{0}.json'.format(name))
 
@@ -2,7 +2,8 @@
 Functions and dictionaries used to shape diverse objects according to the spec. 
 """
 
-import ast 
+import ast
+from functools import lru_cache
 
 from .. import __id__, __beacon_name__, __apiVersion__, __org_id__, __org_name__, __org_description__, __org_adress__, __org_welcomeUrl__, __org_contactUrl__, __org_logoUrl__, __org_info__
 from .. import __description__, __version__, __welcomeUrl__, __alternativeUrl__, __createDateTime__, __updateDateTime__
@@ -69,6 +70,12 @@ sample_allele_request = [ {
   } ]
 
 
+# Both info models only depend on configuration fixed at import time, so the
+# dict is built once per host and reused; callers that extend the result must
+# copy it first (see info_handler). The cache is bounded because the host
+# comes from the client-controlled Host header: a deployment only sees a
+# handful of hostnames, anything beyond that just recycles the LRU
+@lru_cache(maxsize=16)
 def Beacon_v1(host):
     Beacon_v1 = {
         'id': __id__,
@@ -88,6 +95,7 @@ def Beacon_v1(host):
     }
     return Beacon_v1
 
+@lru_cache(maxsize=16)
 def GA4GH_ServiceInfo_v01(host):
     GA4GH_ServiceInfo_v01 = {
         'id': __id__,
@@ -34,6 +34,40 @@ def create_prepstmt_variables(value):
 
 
 
+# (parameter, converter) pairs in the order the SQL query functions expect them,
+# built once so the handlers do not rebuild the lists on every request
+QUERY_PARAMETERS_TABLE = (
+    ("variantType", str),
+    ("start", int),
+    ("startMin", int),
+    ("startMax", int),
+    ("end", int),
+    ("endMin", int),
+    ("endMax", int),
+    ("referenceName", str),
+    ("referenceBases", str),
+    ("alternateBases", str),
+    ("assemblyId", str),
+    ("datasetIds", str),
+    ("filters", str),
+)
+
+
+def request2queryparameters(processed_request):
+    """Convert the processed request into the positional parameter list the SQL functions need.
+
+    Missing integer parameters are passed as None and missing strings as "null".
+    """
+    query_parameters = []
+    for param, converter in QUERY_PARAMETERS_TABLE:
+        query_param = processed_request.get(param)
+        if query_param:
+            query_parameters.append(converter(query_param))
+        else:
+            query_parameters.append(None if converter is int else "null")
+    return query_parameters
+
+
 def filter_exists(include_dataset, datasets):
     """Return those datasets responses that the `includeDatasetResponses` parameter decides.
     Look at the exist parameter in each returned dataset to established HIT or MISS.
@@ -137,12 +171,11 @@ async def prepare_filter_parameter(db_pool, filters_request):
                         FROM ontology_term_column_correspondance
                         WHERE concat_ws(':', ontology, term) IN ({combinations_list})"""
 
-            LOG.debug(f"QUERY filters info: {query}")
-            statement = await connection.prepare(query)
-            db_response = await statement.fetch()
+            LOG.debug("QUERY filters info: %s", query)
+            db_response = await connection.fetch(query)
 
             filter_dict = {}
-            for record in list(db_response):
+            for record in db_response:
                 if record["target_table"] not in filter_dict.keys():
                     filter_dict[record["target_table"]] = {}
                     filter_dict[record["target_table"]][record["column_name"]] = []
@@ -221,7 +254,7 @@ def access_resolution(request, token, host, public_data, registered_data, contro
             raise BeaconUnauthorised(request, host, "missing_token", 'Unauthorized access to dataset(s), missing token.')
         # token is present, but is missing perms (user authed but no access)
         raise BeaconForbidden(request, host, 'Access to dataset(s) is forbidden.')
-    LOG.info(f"Accesible datasets are: {list(access)}.")
+    LOG.info("Accesible datasets are: %s.", list(access))
     return permissions, list(access)
 
 
@@ -235,13 +268,19 @@ async def fetch_datasets_access(db_pool, datasets):
         async with connection.transaction():
             datasets_query = None if datasets == "null" or not datasets else ast.literal_eval(datasets)
             try:
-                query = f"""SELECT access_type, id, stable_id FROM {DB_SCHEMA}.beacon_dataset
-                           WHERE coalesce(stable_id = any($1), true);
-                           """
-                LOG.debug(f"QUERY datasets access: {query}")
-                statement = await connection.prepare(query)
-                db_response = await statement.fetch(datasets_query)
-                for record in list(db_response):
+                # A plain equality filter (instead of coalesce(..., true)) lets
+                # Postgres use the index on stable_id when datasets are given
+                if datasets_query:
+                    query = f"""SELECT access_type, id, stable_id FROM {DB_SCHEMA}.beacon_dataset
+                               WHERE stable_id = any($1);
+                               """
+                    LOG.debug("QUERY datasets access: %s", query)
+                    db_response = await connection.fetch(query, datasets_query)
+                else:
+                    query = f"""SELECT access_type, id, stable_id FROM {DB_SCHEMA}.beacon_dataset;"""
+                    LOG.debug("QUERY datasets access: %s", query)
+                    db_response = await connection.fetch(query)
+                for record in db_response:
                     if record['access_type'] == 'PUBLIC':
                         public.append(record['id'])
                     if record['access_type'] == 'REGISTERED':
@@ -325,7 +364,7 @@ def snp_resultsHandover(variantId):
 
     return resultsHandover
 
-async def fetch_variantAnnotations(variant_details):
+def fetch_variantAnnotations(variant_details):
     """
     Create the a part of the variantsAnnotation response by fetching the cellBase API and the dbSNP API.
     The variant_id has to be in the following format: chrom:start:ref:alt. 
@@ -342,9 +381,18 @@ async def fetch_variantAnnotations(variant_details):
     url = f"http://cellbase.clinbioinfosspa.es/cb/webservices/rest/v4/hsapiens/genomic/variant/{variant_id}/annotation"
     r = requests.get(url)
     cellBase_dict = r.json() if r else ''
+    # Walk the nested response explicitly so the common path pays no exception
+    # machinery; the narrow except only covers malformed third-party payloads
+    # (e.g. an error object where a list is expected), which must degrade to
+    # None instead of failing the whole query
+    cellBase_rsID = None
     try:
-        cellBase_rsID = cellBase_dict["response"][0]["result"][0]["id"]
-    except:
+        if cellBase_dict:
+            cellBase_response = cellBase_dict.get("response")
+            cellBase_result = cellBase_response[0].get("result") if cellBase_response else None
+            if cellBase_result:
+                cellBase_rsID = cellBase_result[0].get("id")
+    except (KeyError, IndexError, TypeError, AttributeError):
         cellBase_rsID = None
 
     # dbSNP
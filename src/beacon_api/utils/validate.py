@@ -1,11 +1,10 @@
 """JSON Request/Response Validation and Token authentication (not implemented yet).
 """
 
-import json
 import re
 import os
 import logging
-from functools import wraps
+from functools import wraps, lru_cache
 import aiohttp
 from aiohttp import web
 
@@ -17,6 +16,10 @@ from ..schemas import load_schema
 
 LOG = logging.getLogger(__name__)
 
+# Parameters that arrive as strings in a GET request but must be typed as integers;
+# a frozenset gives a constant-time membership check per query parameter
+INT_PARAMS = frozenset(('start', 'end', 'endMax', 'endMin', 'startMax', 'startMin'))
+
 # ----------------------------------------------------------------------------------------------------------------------
 #                                                PARSING FUNCTIONS
 # ----------------------------------------------------------------------------------------------------------------------
@@ -36,17 +39,15 @@ async def parse_request_object(request):
         # LOG.info(f"These are the request.items: {request.rel_url.query.items()}")
         
         # GET parameters are returned as strings
-        int_params = ['start', 'end', 'endMax', 'endMin', 'startMax', 'startMin']
-        items = {k: (int(v) if k in int_params else v) for k, v in request.rel_url.query.items()}
+        items = {k: (int(v) if k in INT_PARAMS else v) for k, v in request.rel_url.query.items()}
         if 'datasetIds' in items:
             items['datasetIds'] = request.rel_url.query.get('datasetIds').split(',')
         elif 'filters' in items:
             items['filters'] = request.rel_url.query.get('filters').split(',')
         elif 'customFilters' in items:
             items['customFilters'] = request.rel_url.query.get('customFilters').split(',')
-        obj = json.dumps(items)
         LOG.info('Parsed GET request parameters.')
-        return request.method, json.loads(obj)
+        return request.method, items
 
 
 async def parse_basic_request_object(request):
@@ -58,13 +59,11 @@ async def parse_basic_request_object(request):
         LOG.info('Parsed POST request body.')
         return request.method, await request.json()  # we are always expecting JSON
 
-    if request.method == 'GET':        
-        # GET parameters are returned as strings
-        items = {k: v for k, v in request.rel_url.query.items() if k != "levels"}
-        items.update({k: v.lower() for k, v in request.rel_url.query.items() if k == "levels"})
-        obj = json.dumps(items)
+    if request.method == 'GET':
+        # GET parameters are returned as strings, only "levels" needs lowercasing
+        items = {k: (v.lower() if k == "levels" else v) for k, v in request.rel_url.query.items()}
         LOG.info('Parsed GET request parameters.')
-        return request.method, json.loads(obj)
+        return request.method, items
 
 
 def extend_with_default(validator_class):
@@ -92,6 +91,16 @@ def extend_with_default(validator_class):
 DefaultValidatingDraft7Validator = extend_with_default(Draft7Validator)
 
 
+@lru_cache(maxsize=None)
+def get_validator(endpoint):
+    """Return the schema validator for an endpoint.
+
+    Building a validator compiles the schema (including its regex patterns),
+    so it is done once per endpoint and the instance is reused afterwards.
+    """
+    return DefaultValidatingDraft7Validator(load_schema(endpoint))
+
+
 # ----------------------------------------------------------------------------------------------------------------------
 #                                         QUERY END POINT FURTHER VALIDATION
 # ----------------------------------------------------------------------------------------------------------------------
@@ -207,8 +216,7 @@ def validate(endpoint):
             try:
                 # jsonschema.validate(obj, schema)
                 LOG.info('Validate against JSON schema.')
-                schema = load_schema(endpoint)
-                DefaultValidatingDraft7Validator(schema).validate(obj)
+                get_validator(endpoint).validate(obj)
             except ValidationError as e:
                 if len(e.path) > 0:
                     LOG.error(f'Bad Request: {e.message} caused by input: {e.instance} in {e.path[0]}')
@@ -250,8 +258,7 @@ def validate_services(func):
         try:
             # jsonschema.validate(obj, schema)
             LOG.info('Validate against JSON schema.')
-            schema = load_schema("services")
-            DefaultValidatingDraft7Validator(schema).validate(obj)
+            get_validator("services").validate(obj)
         except ValidationError as e:
             if len(e.path) > 0:
                 LOG.error(f'Bad Request: {e.message} caused by input: {e.instance} in {e.path[0]}')
@@ -279,8 +286,7 @@ def validate_access_levels(func):
         try:
             # jsonschema.validate(obj, schema)
             LOG.info('Validate against JSON schema.')
-            schema = load_schema("access_levels")
-            DefaultValidatingDraft7Validator(schema).validate(obj)
+            get_validator("access_levels").validate(obj)
         except ValidationError as e:
             if len(e.path) > 0:
                 LOG.error(f'Bad Request: {e.message} caused by input: {e.instance} in {e.path[0]}')
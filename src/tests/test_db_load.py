@@ -83,6 +83,30 @@ class Statement(Transaction):
             return {}
 
 
+class Cursor:
+    """Class Cursor.
+
+    Mock this from asyncpg.
+    """
+
+    def __init__(self, accessData):
+        """Initialize class."""
+        self.accessData = accessData or []
+        self._index = 0
+
+    def __aiter__(self):
+        """Return the iterator."""
+        return self
+
+    async def __anext__(self):
+        """Return the next record."""
+        if self._index >= len(self.accessData):
+            raise StopAsyncIteration
+        record = self.accessData[self._index]
+        self._index += 1
+        return record
+
+
 class Connection:
     """Class Connection.
 
@@ -96,7 +120,21 @@ class Connection:
 
     async def fetch(self, *args, **kwargs):
         """Mimic fetch."""
-        return [{"table_name": "DATATSET1"}, {"table_name": "DATATSET2"}]
+        if self.accessData:
+            return self.accessData
+        else:
+            return []
+
+    async def fetchrow(self, *args, **kwargs):
+        """Mimic fetchrow."""
+        if self.accessData:
+            return self.accessData
+        else:
+            return {}
+
+    async def fetchval(self, *args, **kwargs):
+        """Mimic fetchval."""
+        return self.accessData
 
     async def execute(self, query, *args):
         """Mimic execute."""
@@ -119,6 +157,10 @@ class Connection:
         """Mimic prepare."""
         return Statement(query, self.accessData)
 
+    def cursor(self, query, *args, **kwargs):
+        """Mimic cursor."""
+        return Cursor(self.accessData)
+
     def transaction(self, *args, **kwargs):
         """Mimic transaction."""
         return Transaction(*args, **kwargs)